@@ -17,7 +17,15 @@ from typing import Dict, Set, TYPE_CHECKING
 import numpy as np
 from attrs import frozen
 
-from qualtran import Bloq, BloqBuilder, GateWithRegisters, Side, Signature, SoquetT
+from qualtran import (
+    Bloq,
+    BloqBuilder,
+    DecomposeTypeError,
+    GateWithRegisters,
+    Side,
+    Signature,
+    SoquetT,
+)
 from qualtran.symbolics import is_symbolic, SymbolicInt
 
 if TYPE_CHECKING:
@@ -52,6 +60,20 @@ class Power(GateWithRegisters):
         ):
             raise ValueError(f'{self.power=} must be a positive integer.')
 
+    @classmethod
+    def make(cls, bloq: Bloq, power: SymbolicInt) -> Bloq:
+        """Repeat `bloq` `power` times, simplifying the result where possible.
+
+        Nested powers are collapsed, i.e. `Power(Power(b, k), m)` becomes `Power(b, k * m)`, and
+        a power of one returns `bloq` itself.
+        """
+        while isinstance(bloq, Power):
+            power = bloq.power * power
+            bloq = bloq.bloq
+        if not is_symbolic(power) and power == 1:
+            return bloq
+        return cls(bloq, power)
+
     def adjoint(self) -> 'Bloq':
         return Power(self.bloq.adjoint(), self.power)
 
@@ -60,18 +82,25 @@ class Power(GateWithRegisters):
         return self.bloq.signature
 
     def build_composite_bloq(self, bb: 'BloqBuilder', **soqs: 'SoquetT') -> Dict[str, 'SoquetT']:
-        if not isinstance(self.power, int):
-            raise ValueError(f'Symbolic power {self.power} not supported')
-        for _ in range(self.power):
+        if is_symbolic(self.power):
+            raise DecomposeTypeError(f'Cannot decompose {self} with symbolic power {self.power}.')
+        # Exponentiation by squaring: `bloq^p = (bloq^(p//2))^2 bloq^(p%2)`. Each level adds at
+        # most three subbloqs, so the full decomposition is only `O(log p)` levels deep.
+        half, rem = divmod(int(self.power), 2)
+        if half:
+            half_bloq = Power.make(self.bloq, half)
+            soqs = bb.add_d(half_bloq, **soqs)
+            soqs = bb.add_d(half_bloq, **soqs)
+        if rem:
             soqs = bb.add_d(self.bloq, **soqs)
         return soqs
 
     def build_call_graph(self, ssa: 'SympySymbolAllocator') -> Set['BloqCountT']:
         return {(self.bloq, self.power)}
 
-    def __pow__(self, power) -> 'Power':
+    def __pow__(self, power) -> 'Bloq':
         bloq = self.bloq.adjoint() if power < 0 else self.bloq
-        return Power(bloq, self.power * abs(power))
+        return Power.make(bloq, self.power * abs(power))
 
     def _circuit_diagram_info_(
         self, args: 'cirq.CircuitDiagramInfoArgs'
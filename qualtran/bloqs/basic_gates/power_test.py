@@ -14,12 +14,16 @@
 import subprocess
 
 import cirq
+import numpy as np
 import pytest
+import sympy
 
+from qualtran import DecomposeTypeError
 from qualtran._infra.gate_with_registers import GateWithRegisters
 from qualtran.bloqs.basic_gates import Power
 from qualtran.bloqs.for_testing import TestAtom, TestMultiRegister
 from qualtran.bloqs.for_testing.atom import TestGWRAtom
+from qualtran.resource_counting import SympySymbolAllocator
 
 
 def test_power():
@@ -35,9 +39,25 @@ def test_power():
     bloq_raised_to_power = Power(bloq, 10)
     assert bloq_raised_to_power.signature == bloq.signature
     cbloq = bloq_raised_to_power.decompose_bloq()
+    assert [binst.bloq for binst, _, _ in cbloq.iter_bloqnections()] == [Power(bloq, 5)] * 2
+    cbloq = cbloq.flatten(lambda binst: isinstance(binst.bloq, Power))
     assert [binst.bloq for binst, _, _ in cbloq.iter_bloqnections()] == [bloq] * 10
 
 
+def test_power_decomposition_by_squaring():
+    bloq = TestAtom()
+    cbloq = Power(bloq, 7).decompose_bloq()
+    bloqs = [binst.bloq for binst, _, _ in cbloq.iter_bloqnections()]
+    assert bloqs == [Power(bloq, 3), Power(bloq, 3), bloq]
+
+    cbloq = Power(bloq, 1).decompose_bloq()
+    assert [binst.bloq for binst, _, _ in cbloq.iter_bloqnections()] == [bloq]
+
+    cbloq = Power(bloq, 1000).decompose_bloq()
+    cbloq = cbloq.flatten(lambda binst: isinstance(binst.bloq, Power))
+    assert [binst.bloq for binst, _, _ in cbloq.iter_bloqnections()] == [bloq] * 1000
+
+
 def test_power_of_power():
     bloq = TestAtom()
     assert Power(bloq, 6) == Power(bloq, 2) ** 3
@@ -48,6 +68,27 @@ def test_power_of_power():
     assert gate**6 == (gate**-2) ** -3
 
 
+def test_power_symbolic():
+    n = sympy.Symbol('n')
+    bloq = Power(TestAtom(), n)
+    assert bloq.build_call_graph(SympySymbolAllocator()) == {(TestAtom(), n)}
+    with pytest.raises(DecomposeTypeError):
+        bloq.decompose_bloq()
+
+    cbloq = Power(TestAtom(), np.int64(5)).decompose_bloq()
+    bloqs = [binst.bloq for binst, _, _ in cbloq.iter_bloqnections()]
+    assert bloqs == [Power(TestAtom(), 2), Power(TestAtom(), 2), TestAtom()]
+
+
+def test_power_make():
+    bloq = TestAtom()
+    assert Power.make(bloq, 1) == bloq
+    assert Power.make(bloq, 3) == Power(bloq, 3)
+    assert Power.make(Power(bloq, 2), 3) == Power(bloq, 6)
+    assert Power.make(Power(Power(bloq, 2), 3), 5) == Power(bloq, 30)
+    assert Power(Power(bloq, 2), 3) ** 2 == Power(bloq, 12)
+
+
 def test_power_circuit_diagram():
     def to_cirq_circuit(bloq: GateWithRegisters) -> cirq.Circuit:
         op = bloq.on(*cirq.LineQubit.range(bloq.num_qubits()))
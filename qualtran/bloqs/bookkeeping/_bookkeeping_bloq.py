@@ -13,12 +13,15 @@
 #  limitations under the License.
 
 import abc
-from typing import Dict, Iterable, Optional, Sequence, Tuple, TYPE_CHECKING
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple, TYPE_CHECKING
+
+import numpy as np
 
 from qualtran import Bloq, BloqBuilder, SoquetT
 from qualtran.cirq_interop.t_complexity_protocol import TComplexity
 
 if TYPE_CHECKING:
+    import quimb.tensor as qtn
 
     from qualtran import AddControlledT, CtrlSpec
 
@@ -45,3 +48,45 @@ class _BookkeepingBloq(Bloq, metaclass=abc.ABCMeta):
 
     def _t_complexity_(self) -> 'TComplexity':
         return TComplexity()
+
+    def _add_delta_tensor(
+        self, tn: 'qtn.TensorNetwork', tag: Any, inds: Sequence[Any], shape: Tuple[int, ...]
+    ) -> None:
+        """Add the tensor identifying the joint index `inds[:-1]` with the index `inds[-1]`.
+
+        `shape` gives the dimension of each index in `inds`. A two-index delta is the identity
+        matrix.
+        """
+        import quimb.tensor as qtn
+
+        if len(inds) == 2:
+            data = np.eye(shape[-1])
+        else:
+            data = _delta_tensor_data(shape[:-1], shape[-1])
+        tn.add(qtn.Tensor(data=data, inds=inds, tags=[self.__class__.__name__, tag]))
+
+
+def _delta_tensor_data(shape: Tuple[int, ...], d: int) -> np.ndarray:
+    """Tensor data identifying the multi-index over `shape` with a single index of size `d`.
+
+    This is the reshaped identity `np.eye(d).reshape(shape + (d,))`, but the non-zero
+    entries are written directly with one fancy-indexed assignment instead of materializing
+    the square identity matrix first.
+    """
+    if not shape:
+        return np.ones((d,))
+    data = np.zeros(tuple(shape) + (d,))
+    idx = np.arange(d)
+    data[np.unravel_index(idx, shape) + (idx,)] = 1.0
+    return data
+
+
+def _zero_state_data(n: int) -> np.ndarray:
+    """The state vector of `n` qubits in the all-zeros state.
+
+    A new array is returned on every call. A single-tensor network contracts to its tensor's
+    own data, so sharing this array between tensors would leak it to `tensor_contract()` callers.
+    """
+    data = np.zeros(1 << n)
+    data[0] = 1
+    return data
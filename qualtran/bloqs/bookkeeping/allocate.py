@@ -11,10 +11,9 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from functools import cached_property
+from functools import cached_property, lru_cache
 from typing import Any, Dict, Tuple, TYPE_CHECKING
 
-import numpy as np
 import sympy
 from attrs import frozen
 
@@ -31,13 +30,19 @@ from qualtran import (
     Signature,
     SoquetT,
 )
-from qualtran.bloqs.bookkeeping._bookkeeping_bloq import _BookkeepingBloq
+from qualtran.bloqs.bookkeeping._bookkeeping_bloq import _BookkeepingBloq, _zero_state_data
 from qualtran.drawing import directional_text_box, Text, WireSymbol
 
 if TYPE_CHECKING:
     import quimb.tensor as qtn
 
 
+@lru_cache(maxsize=None)
+def _allocate_signature(dtype: QDType) -> Signature:
+    """The signature of `Allocate(dtype)`, shared between all instances with equal `dtype`."""
+    return Signature([Register('reg', dtype, side=Side.RIGHT)])
+
+
 @frozen
 class Allocate(_BookkeepingBloq):
     """Allocate an `n` bit register.
@@ -53,7 +58,7 @@ class Allocate(_BookkeepingBloq):
 
     @cached_property
     def signature(self) -> Signature:
-        return Signature([Register('reg', self.dtype, side=Side.RIGHT)])
+        return _allocate_signature(self.dtype)
 
     def decompose_bloq(self) -> 'CompositeBloq':
         raise DecomposeTypeError(f'{self} is atomic.')
@@ -76,8 +81,7 @@ class Allocate(_BookkeepingBloq):
     ):
         import quimb.tensor as qtn
 
-        data = np.zeros(1 << self.dtype.num_qubits)
-        data[0] = 1
+        data = _zero_state_data(self.dtype.num_qubits)
         tn.add(qtn.Tensor(data=data, inds=(outgoing['reg'],), tags=['Allocate', tag]))
 
     def wire_symbol(self, reg: Register, idx: Tuple[int, ...] = tuple()) -> 'WireSymbol':
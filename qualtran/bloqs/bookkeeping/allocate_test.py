@@ -16,8 +16,8 @@ import subprocess
 import numpy as np
 import pytest
 
-from qualtran import BloqBuilder, QAny
-from qualtran.bloqs.bookkeeping import Allocate, Free
+from qualtran import BloqBuilder, QAny, QFxp, QInt
+from qualtran.bloqs.bookkeeping import Allocate, Cast, Free, Split
 from qualtran.bloqs.bookkeeping.allocate import _alloc
 from qualtran.testing import execute_notebook
 
@@ -37,6 +37,29 @@ def test_free_nonzero_state_vector_leads_to_unnormalized_state():
     assert np.allclose(bb.finalize().tensor_contract(), np.sqrt(1 / 2**10))
 
 
+def test_alloc_free_tensor_contract():
+    vec = np.zeros(2**3)
+    vec[0] = 1
+    np.testing.assert_allclose(Allocate(QAny(3)).tensor_contract(), vec)
+    np.testing.assert_allclose(Free(QAny(3)).tensor_contract(), vec)
+
+    bb = BloqBuilder()
+    qs = bb.add(Allocate(QAny(3)))
+    bb.add(Free(QAny(3)), reg=qs)
+    assert np.allclose(bb.finalize().tensor_contract(), 1.0)
+
+
+@pytest.mark.parametrize(
+    'bloq', [Allocate(QAny(3)), Free(QAny(3)), Cast(QInt(4), QFxp(4, 4)), Split(QAny(1))]
+)
+def test_tensor_contract_result_is_independent(bloq):
+    vec = bloq.tensor_contract()
+    assert vec.flags.writeable
+    vec[...] = 5
+    assert not np.shares_memory(vec, bloq.tensor_contract())
+    assert bloq.tensor_contract().flat[0] == 1
+
+
 @pytest.mark.notebook
 def test_notebook():
     execute_notebook('bookkeeping')
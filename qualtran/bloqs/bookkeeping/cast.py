@@ -11,11 +11,10 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from functools import cached_property
+from functools import cached_property, lru_cache
 from typing import Any, Dict, Tuple, TYPE_CHECKING
 
 import attrs
-import numpy as np
 from attrs import frozen
 
 from qualtran import (
@@ -39,6 +38,17 @@ if TYPE_CHECKING:
     from qualtran.simulation.classical_sim import ClassicalValT
 
 
+@lru_cache(maxsize=None)
+def _cast_signature(inp_dtype: QDType, out_dtype: QDType, shape: Tuple[int, ...]) -> Signature:
+    """The signature of `Cast`, shared between all instances with equal attributes."""
+    return Signature(
+        [
+            Register('reg', dtype=inp_dtype, shape=shape, side=Side.LEFT),
+            Register('reg', dtype=out_dtype, shape=shape, side=Side.RIGHT),
+        ]
+    )
+
+
 @frozen
 class Cast(_BookkeepingBloq):
     """Cast a register from one n-bit QDType to another QDType.
@@ -71,12 +81,11 @@ class Cast(_BookkeepingBloq):
 
     @cached_property
     def signature(self) -> Signature:
-        return Signature(
-            [
-                Register('reg', dtype=self.inp_dtype, shape=self.shape, side=Side.LEFT),
-                Register('reg', dtype=self.out_dtype, shape=self.shape, side=Side.RIGHT),
-            ]
-        )
+        return _cast_signature(self.inp_dtype, self.out_dtype, self.shape)
+
+    @cached_property
+    def _d(self) -> int:
+        return 1 << self.inp_dtype.num_qubits
 
     def adjoint(self) -> 'Bloq':
         return Cast(inp_dtype=self.out_dtype, out_dtype=self.inp_dtype)
@@ -89,15 +98,7 @@ class Cast(_BookkeepingBloq):
         incoming: Dict[str, 'SoquetT'],
         outgoing: Dict[str, 'SoquetT'],
     ):
-        import quimb.tensor as qtn
-
-        tn.add(
-            qtn.Tensor(
-                data=np.eye(2**self.inp_dtype.num_qubits, 2**self.inp_dtype.num_qubits),
-                inds=[outgoing['reg']] + [incoming['reg']],
-                tags=['Cast', tag],
-            )
-        )
+        self._add_delta_tensor(tn, tag, [outgoing['reg'], incoming['reg']], (self._d, self._d))
 
     def on_classical_vals(self, reg: int) -> Dict[str, 'ClassicalValT']:
         # TODO: Actually cast the values https://github.com/quantumlib/Qualtran/issues/734
@@ -13,6 +13,8 @@
 #  limitations under the License.
 import subprocess
 
+import numpy as np
+
 from qualtran import QFxp, QInt
 from qualtran.bloqs.bookkeeping import Cast
 from qualtran.bloqs.bookkeeping.cast import _cast
@@ -31,6 +33,11 @@ def test_cast_tensor_contraction():
     assert tn.shape == (2**4,) * 4
 
 
+def test_cast_tensor_data():
+    c = Cast(QInt(4), QFxp(4, 4))
+    np.testing.assert_allclose(c.tensor_contract(), np.eye(2**4))
+
+
 def test_cast_classical_sim():
     c = Cast(QInt(8), QFxp(8, 8))
     (y,) = c.call_classically(reg=7)
@@ -12,10 +12,9 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from functools import cached_property
+from functools import cached_property, lru_cache
 from typing import Any, Dict, Tuple, TYPE_CHECKING
 
-import numpy as np
 import sympy
 from attrs import frozen
 
@@ -32,7 +31,7 @@ from qualtran import (
     Signature,
     SoquetT,
 )
-from qualtran.bloqs.bookkeeping._bookkeeping_bloq import _BookkeepingBloq
+from qualtran.bloqs.bookkeeping._bookkeeping_bloq import _BookkeepingBloq, _zero_state_data
 from qualtran.drawing import directional_text_box, Text, WireSymbol
 
 if TYPE_CHECKING:
@@ -41,6 +40,12 @@ if TYPE_CHECKING:
     from qualtran.simulation.classical_sim import ClassicalValT
 
 
+@lru_cache(maxsize=None)
+def _free_signature(dtype: QDType) -> Signature:
+    """The signature of `Free(dtype)`, shared between all instances with equal `dtype`."""
+    return Signature([Register('reg', dtype, side=Side.LEFT)])
+
+
 @frozen
 class Free(_BookkeepingBloq):
     """Free (i.e. de-allocate) a register.
@@ -60,7 +65,7 @@ class Free(_BookkeepingBloq):
 
     @cached_property
     def signature(self) -> Signature:
-        return Signature([Register('reg', self.dtype, side=Side.LEFT)])
+        return _free_signature(self.dtype)
 
     def decompose_bloq(self) -> 'CompositeBloq':
         raise DecomposeTypeError(f'{self} is atomic.')
@@ -85,8 +90,7 @@ class Free(_BookkeepingBloq):
     ):
         import quimb.tensor as qtn
 
-        data = np.zeros(1 << self.dtype.num_qubits)
-        data[0] = 1
+        data = _zero_state_data(self.dtype.num_qubits)
         tn.add(qtn.Tensor(data=data, inds=(incoming['reg'],), tags=['Free', tag]))
 
     def wire_symbol(self, reg: Register, idx: Tuple[int, ...] = tuple()) -> 'WireSymbol':
@@ -11,7 +11,7 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from functools import cached_property
+from functools import cached_property, lru_cache
 from typing import Any, Dict, Optional, Tuple, TYPE_CHECKING
 
 import numpy as np
@@ -33,7 +33,6 @@ from qualtran import (
 )
 from qualtran.bloqs.bookkeeping._bookkeeping_bloq import _BookkeepingBloq
 from qualtran.drawing import directional_text_box, Text, WireSymbol
-from qualtran.simulation.classical_sim import bits_to_ints
 
 if TYPE_CHECKING:
     import quimb.tensor as qtn
@@ -41,6 +40,20 @@ if TYPE_CHECKING:
 
     from qualtran.cirq_interop import CirqQuregT
 
+# Powers of two, used to compact big-endian bitstrings of up to 64 bits.
+_POW2 = 2 ** np.arange(64, dtype=np.uint64)
+
+
+@lru_cache(maxsize=None)
+def _join_signature(dtype: QDType) -> Signature:
+    """The signature of `Join(dtype)`, shared between all instances with equal `dtype`."""
+    return Signature(
+        [
+            Register('reg', QBit(), shape=(dtype.num_qubits,), side=Side.LEFT),
+            Register('reg', dtype, shape=tuple(), side=Side.RIGHT),
+        ]
+    )
+
 
 @frozen
 class Join(_BookkeepingBloq):
@@ -58,12 +71,15 @@ class Join(_BookkeepingBloq):
 
     @cached_property
     def signature(self) -> Signature:
-        return Signature(
-            [
-                Register('reg', QBit(), shape=(self.dtype.num_qubits,), side=Side.LEFT),
-                Register('reg', self.dtype, shape=tuple(), side=Side.RIGHT),
-            ]
-        )
+        return _join_signature(self.dtype)
+
+    @cached_property
+    def _n(self) -> int:
+        return self.dtype.num_qubits
+
+    @cached_property
+    def _d(self) -> int:
+        return 1 << self._n
 
     @dtype.validator
     def _validate_dtype(self, attribute, value):
@@ -79,7 +95,7 @@ class Join(_BookkeepingBloq):
         return Split(dtype=self.dtype)
 
     def as_cirq_op(self, qubit_manager, reg: 'CirqQuregT') -> Tuple[None, Dict[str, 'CirqQuregT']]:
-        return None, {'reg': reg.reshape(self.dtype.num_qubits)}
+        return None, {'reg': reg.reshape(self._n)}
 
     def add_my_tensors(
         self,
@@ -89,22 +105,16 @@ class Join(_BookkeepingBloq):
         incoming: Dict[str, 'SoquetT'],
         outgoing: Dict[str, 'SoquetT'],
     ):
-        import quimb.tensor as qtn
-
         if not isinstance(incoming['reg'], np.ndarray):
             raise ValueError('Incoming register must be a numpy array')
-        tn.add(
-            qtn.Tensor(
-                data=np.eye(2**self.dtype.num_qubits, 2**self.dtype.num_qubits).reshape(
-                    (2,) * self.dtype.num_qubits + (2**self.dtype.num_qubits,)
-                ),
-                inds=incoming['reg'].tolist() + [outgoing['reg']],
-                tags=['Join', tag],
-            )
+        self._add_delta_tensor(
+            tn, tag, incoming['reg'].tolist() + [outgoing['reg']], (2,) * self._n + (self._d,)
         )
 
     def on_classical_vals(self, reg: 'NDArray[np.uint]') -> Dict[str, int]:
-        return {'reg': bits_to_ints(reg)[0]}
+        if self._n > 64:
+            raise NotImplementedError(f'{self} only supports values of up to 64 bits.')
+        return {'reg': np.asarray(reg, dtype=np.uint64).dot(_POW2[: self._n][::-1])}
 
     def wire_symbol(self, reg: Optional[Register], idx: Tuple[int, ...] = tuple()) -> 'WireSymbol':
         if reg is None:
@@ -55,5 +55,23 @@ def test_util_bloqs_tensor_contraction():
     np.testing.assert_allclose(cbloq.tensor_contract(), expected)
 
 
+@pytest.mark.parametrize('n', [1, 8, 64])
+def test_split_join_classical_roundtrip(n):
+    for x in {0, 2**n - 1, (2**n - 1) // 3}:
+        (bits,) = Split(QAny(n)).call_classically(reg=x)
+        assert isinstance(bits, np.ndarray)
+        assert bits.tolist() == [int(b) for b in format(x, f'0{n}b')]
+        (y,) = Join(QAny(n)).call_classically(reg=bits)
+        assert y == x
+
+
+def test_split_join_zero_width_classical_vals():
+    # Zero-width registers cannot be wired into a composite bloq, so call the bloqs directly.
+    bits = Split(QAny(0)).on_classical_vals(reg=0)['reg']
+    assert isinstance(bits, np.ndarray)
+    assert bits.shape == (0,)
+    assert Join(QAny(0)).on_classical_vals(reg=np.array([], dtype=np.uint8))['reg'] == 0
+
+
 def test_no_circular_import():
     subprocess.check_call(['python', '-c', 'from qualtran.bloqs.bookkeeping import join'])
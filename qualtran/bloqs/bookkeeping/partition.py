@@ -11,7 +11,9 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from functools import cached_property
+from functools import cached_property, lru_cache
+from itertools import accumulate
+from math import prod
 from typing import Any, Dict, Tuple, TYPE_CHECKING
 
 import attrs
@@ -31,19 +33,49 @@ from qualtran import (
 )
 from qualtran.bloqs.bookkeeping._bookkeeping_bloq import _BookkeepingBloq
 from qualtran.drawing import directional_text_box, Text, WireSymbol
-from qualtran.simulation.classical_sim import bits_to_ints, ints_to_bits
 
 if TYPE_CHECKING:
     import quimb.tensor as qtn
+    from numpy.typing import NDArray
 
     from qualtran.cirq_interop import CirqQuregT
     from qualtran.simulation.classical_sim import ClassicalValT
 
 
+@lru_cache(maxsize=None)
+def _partition_signature(n: int, regs: Tuple[Register, ...], partition: bool) -> Signature:
+    """The signature of `Partition`, shared between all instances with equal attributes."""
+    lumped = Side.LEFT if partition else Side.RIGHT
+    partitioned = Side.RIGHT if partition else Side.LEFT
+
+    return Signature(
+        [Register('x', QAny(bitsize=n), side=lumped)]
+        + [attrs.evolve(reg, side=partitioned) for reg in regs]
+    )
+
+
+def _partition_int_to_regs(
+    x: 'ClassicalValT', shifts: 'NDArray[np.uint64]', masks: 'NDArray[np.uint64]'
+) -> 'NDArray[np.uint64]':
+    """Split the integer `x` into the flat register values described by `shifts` and `masks`."""
+    return (np.uint64(x) >> shifts) & masks
+
+
+def _unpartition_regs_to_int(
+    ints: 'NDArray[np.uint64]', shifts: 'NDArray[np.uint64]', masks: 'NDArray[np.uint64]'
+) -> np.uint64:
+    """Combine the flat register values `ints` into one integer; the inverse of the above."""
+    return np.bitwise_or.reduce((ints & masks) << shifts)
+
+
 @frozen
 class Partition(_BookkeepingBloq):
     """Partition a generic index into multiple registers.
 
+    In classical simulation, `x` and every scalar register take Python integer values, and shaped
+    registers take `np.uint64` arrays. When all registers in `regs` are scalars, `n` may be
+    arbitrarily large; otherwise classical simulation supports at most 64 bits.
+
     Args:
         n: The total bitsize of the un-partitioned register
         regs: Registers to partition into. The `side` attribute is ignored.
@@ -60,13 +92,7 @@ class Partition(_BookkeepingBloq):
 
     @cached_property
     def signature(self) -> 'Signature':
-        lumped = Side.LEFT if self.partition else Side.RIGHT
-        partitioned = Side.RIGHT if self.partition else Side.LEFT
-
-        return Signature(
-            [Register('x', QAny(bitsize=self.n), side=lumped)]
-            + [attrs.evolve(reg, side=partitioned) for reg in self.regs]
-        )
+        return _partition_signature(self.n, self.regs, self.partition)
 
     def decompose_bloq(self) -> 'CompositeBloq':
         raise DecomposeTypeError(f'{self} is atomic')
@@ -74,18 +100,35 @@ class Partition(_BookkeepingBloq):
     def adjoint(self):
         return attrs.evolve(self, partition=not self.partition)
 
+    @cached_property
+    def _counts(self) -> Tuple[int, ...]:
+        """The number of values held by each register in `regs`."""
+        return tuple(prod(reg.shape) for reg in self.regs)
+
+    @cached_property
+    def _value_starts(self) -> Tuple[int, ...]:
+        """Offsets of each register's values when all values are flattened; ends with the total."""
+        return tuple(accumulate(self._counts, initial=0))
+
+    @cached_property
+    def _qubit_starts(self) -> Tuple[int, ...]:
+        """Offsets of each register's qubits within `x`; ends with the total."""
+        sizes = (count * reg.bitsize for reg, count in zip(self.regs, self._counts))
+        return tuple(accumulate(sizes, initial=0))
+
     def as_cirq_op(self, qubit_manager, **cirq_quregs) -> Tuple[None, Dict[str, 'CirqQuregT']]:
+        starts = self._qubit_starts
         if self.partition:
+            x = np.asarray(cirq_quregs['x'])
             outregs = {}
-            start = 0
-            for reg in self.regs:
-                shape = reg.shape + (reg.bitsize,)
-                size = int(np.prod(shape))
-                outregs[reg.name] = np.array(cirq_quregs['x'][start : start + size]).reshape(shape)
-                start += size
+            for reg, start, stop in zip(self.regs, starts, starts[1:]):
+                outregs[reg.name] = x[start:stop].reshape(reg.shape + (reg.bitsize,))
             return None, outregs
         else:
-            return None, {'x': np.concatenate([v.ravel() for _, v in cirq_quregs.items()])}
+            x = np.empty(self.n, dtype=object)
+            for reg, start, stop in zip(self.regs, starts, starts[1:]):
+                x[start:stop] = np.asarray(cirq_quregs[reg.name]).ravel()
+            return None, {'x': x}
 
     def add_my_tensors(
         self,
@@ -95,63 +138,80 @@ class Partition(_BookkeepingBloq):
         incoming: Dict[str, 'SoquetT'],
         outgoing: Dict[str, 'SoquetT'],
     ):
-        import quimb.tensor as qtn
-
         unitary_shape = []
         soquets = []
         _incoming = incoming if self.partition else outgoing
         _outgoing = outgoing if self.partition else incoming
-        for reg in self.regs:
-            for i in range(int(np.prod(reg.shape))):
-                unitary_shape.append(2**reg.bitsize)
-                outgoing_reg = _outgoing[reg.name]
-                if isinstance(outgoing_reg, np.ndarray):
-                    soquets.append(outgoing_reg.ravel()[i])
-                else:
-                    soquets.append(outgoing_reg)
-
-        tn.add(
-            qtn.Tensor(
-                data=np.eye(2**self.n, 2**self.n).reshape(
-                    tuple(unitary_shape) + (2**self.n,)
-                ),
-                inds=soquets + [_incoming['x']],
-                tags=['Partition', tag],
-            )
+        for reg, count in zip(self.regs, self._counts):
+            unitary_shape.extend([2**reg.bitsize] * count)
+            outgoing_reg = _outgoing[reg.name]
+            if isinstance(outgoing_reg, np.ndarray):
+                soquets.extend(outgoing_reg.ravel().tolist())
+            else:
+                soquets.append(outgoing_reg)
+
+        self._add_delta_tensor(
+            tn, tag, soquets + [_incoming['x']], tuple(unitary_shape) + (2**self.n,)
         )
 
+    @cached_property
+    def _all_scalar(self) -> bool:
+        return all(reg.shape == () for reg in self.regs)
+
+    @cached_property
+    def _classical_shifts_and_masks(self) -> Tuple['NDArray[np.uint64]', 'NDArray[np.uint64]']:
+        """The offset from the LSB of `x` and the bitmask of each flattened register value."""
+        bitsizes = [
+            reg.bitsize for reg, count in zip(self.regs, self._counts) for _ in range(count)
+        ]
+        shifts = np.asarray(self.n - np.cumsum(bitsizes), dtype=np.uint64)
+        masks = np.array([(1 << bitsize) - 1 for bitsize in bitsizes], dtype=np.uint64)
+        return shifts, masks
+
     def _classical_partition(self, x: 'ClassicalValT') -> Dict[str, 'ClassicalValT']:
+        shifts, masks = self._classical_shifts_and_masks
+        ints = _partition_int_to_regs(x, shifts, masks)
         out_vals = {}
-        xbits = ints_to_bits(x, self.n)[0]
-        start = 0
-        for reg in self.regs:
-            size = int(np.prod(reg.shape + (reg.bitsize,)))
-            bits_reg = xbits[start : start + size]
+        starts = self._value_starts
+        for reg, start, stop in zip(self.regs, starts, starts[1:]):
             if reg.shape == ():
-                out_vals[reg.name] = bits_to_ints(bits_reg)[0]
+                out_vals[reg.name] = int(ints[start])
             else:
-                ints_reg = bits_to_ints(
-                    [
-                        bits_reg[i * reg.bitsize : (i + 1) * reg.bitsize]
-                        for i in range(np.prod(reg.shape))
-                    ]
-                )
-                out_vals[reg.name] = np.array(ints_reg).reshape(reg.shape)
-            start += size
+                out_vals[reg.name] = ints[start:stop].reshape(reg.shape)
         return out_vals
 
     def _classical_unpartition(self, **vals: 'ClassicalValT'):
-        out_vals = []
+        shifts, masks = self._classical_shifts_and_masks
+        ints = np.empty(len(shifts), dtype=np.uint64)
+        starts = self._value_starts
+        for reg, start, stop in zip(self.regs, starts, starts[1:]):
+            ints[start:stop] = np.ravel(vals[reg.name])
+        return {'x': int(_unpartition_regs_to_int(ints, shifts, masks))}
+
+    def _classical_partition_scalars(self, x: 'ClassicalValT') -> Dict[str, 'ClassicalValT']:
+        x = int(x)
+        out_vals: Dict[str, 'ClassicalValT'] = {}
+        shift = self.n
         for reg in self.regs:
-            reg_val = vals[reg.name]
-            if isinstance(reg_val, np.ndarray):
-                out_vals.append(ints_to_bits(reg_val.ravel(), reg.bitsize).ravel())
-            else:
-                out_vals.append(ints_to_bits(reg_val, reg.bitsize)[0])
-        big_int = np.concatenate(out_vals)
-        return {'x': bits_to_ints(big_int)[0]}
+            shift -= reg.bitsize
+            out_vals[reg.name] = (x >> shift) & ((1 << reg.bitsize) - 1)
+        return out_vals
+
+    def _classical_unpartition_scalars(self, **vals: 'ClassicalValT'):
+        x = 0
+        for reg in self.regs:
+            x = (x << reg.bitsize) | (int(vals[reg.name]) & ((1 << reg.bitsize) - 1))
+        return {'x': x}
 
     def on_classical_vals(self, **vals: 'ClassicalValT') -> Dict[str, 'ClassicalValT']:
+        if self._all_scalar:
+            # Fast path: plain Python integer arithmetic, without any intermediate arrays.
+            if self.partition:
+                return self._classical_partition_scalars(vals['x'])
+            return self._classical_unpartition_scalars(**vals)
+
+        if self.n > 64:
+            raise NotImplementedError(f'{self} only supports values of up to 64 bits.')
         if self.partition:
             return self._classical_partition(vals['x'])
         else:
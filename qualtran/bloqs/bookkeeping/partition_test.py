@@ -17,6 +17,7 @@ from typing import Dict
 
 import cirq
 import numpy as np
+import pytest
 from attrs import frozen
 
 from qualtran import Bloq, BloqBuilder, QAny, Register, Signature, Soquet, SoquetT
@@ -106,5 +107,42 @@ def test_partition_call_classically():
     assert out[0] == 64
 
 
+def test_partition_call_classically_wide():
+    regs = (Register('xx', QAny(4), shape=(3,)), Register('yy', QAny(52)))
+    bloq = Partition(n=64, regs=regs)
+    xx, yy = bloq.call_classically(x=2**64 - 1)
+    assert isinstance(xx, np.ndarray)
+    assert xx.tolist() == [15, 15, 15]
+    assert yy == 2**52 - 1
+    (x,) = bloq.adjoint().call_classically(xx=np.array([1, 2, 3]), yy=5)
+    assert x == (1 << 60) + (2 << 56) + (3 << 52) + 5
+
+
+def test_partition_call_classically_scalars():
+    regs = (Register('xx', QAny(3)), Register('yy', QAny(70)), Register('zz', QAny(1)))
+    bloq = Partition(n=74, regs=regs)
+    xx, yy, zz = bloq.call_classically(x=(5 << 71) + (2**70 - 2) * 2 + 1)
+    assert (xx, yy, zz) == (5, 2**70 - 2, 1)
+    (x,) = bloq.adjoint().call_classically(xx=xx, yy=yy, zz=zz)
+    assert x == (5 << 71) + (2**70 - 2) * 2 + 1
+
+
+def test_partition_classical_value_types():
+    scalar_regs = (Register('xx', QAny(2)), Register('yy', QAny(3)))
+    mixed_regs = (Register('xx', QAny(2), shape=(2,)), Register('yy', QAny(3)))
+    for regs in [scalar_regs, mixed_regs]:
+        bitsize = sum(reg.total_bits() for reg in regs)
+        bloq = Partition(n=bitsize, regs=regs)
+        out = bloq.call_classically(x=5)
+        assert type(out[1]) is int
+        (x,) = bloq.adjoint().call_classically(**{reg.name: v for reg, v in zip(regs, out)})
+        assert type(x) is int
+        assert x == 5
+
+    wide = Partition(n=66, regs=(Register('xx', QAny(33), shape=(2,)),))
+    with pytest.raises(NotImplementedError):
+        wide.call_classically(x=1)
+
+
 def test_no_circular_import():
     subprocess.check_call(['python', '-c', 'from qualtran.bloqs.bookkeeping import partition'])
@@ -12,7 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from functools import cached_property
+from functools import cached_property, lru_cache
 from typing import Any, Dict, Optional, Tuple, TYPE_CHECKING
 
 import numpy as np
@@ -34,7 +34,6 @@ from qualtran import (
 )
 from qualtran.bloqs.bookkeeping._bookkeeping_bloq import _BookkeepingBloq
 from qualtran.drawing import directional_text_box, Text, WireSymbol
-from qualtran.simulation.classical_sim import ints_to_bits
 
 if TYPE_CHECKING:
     import quimb.tensor as qtn
@@ -43,6 +42,17 @@ if TYPE_CHECKING:
     from qualtran.simulation.classical_sim import ClassicalValT
 
 
+@lru_cache(maxsize=None)
+def _split_signature(dtype: QDType) -> Signature:
+    """The signature of `Split(dtype)`, shared between all instances with equal `dtype`."""
+    return Signature(
+        [
+            Register('reg', dtype, shape=tuple(), side=Side.LEFT),
+            Register('reg', QBit(), shape=(dtype.num_qubits,), side=Side.RIGHT),
+        ]
+    )
+
+
 @frozen
 class Split(_BookkeepingBloq):
     """Split a register of a given `dtype` into an array of `QBit`s.
@@ -63,12 +73,15 @@ class Split(_BookkeepingBloq):
 
     @cached_property
     def signature(self) -> Signature:
-        return Signature(
-            [
-                Register('reg', self.dtype, shape=tuple(), side=Side.LEFT),
-                Register('reg', QBit(), shape=(self.dtype.num_qubits,), side=Side.RIGHT),
-            ]
-        )
+        return _split_signature(self.dtype)
+
+    @cached_property
+    def _n(self) -> int:
+        return self.dtype.num_qubits
+
+    @cached_property
+    def _d(self) -> int:
+        return 1 << self._n
 
     @dtype.validator
     def _validate_dtype(self, attribute, value):
@@ -84,10 +97,11 @@ class Split(_BookkeepingBloq):
         return Join(dtype=self.dtype)
 
     def as_cirq_op(self, qubit_manager, reg: 'CirqQuregT') -> Tuple[None, Dict[str, 'CirqQuregT']]:
-        return None, {'reg': reg.reshape((self.dtype.num_qubits, 1))}
+        return None, {'reg': reg.reshape((self._n, 1))}
 
     def on_classical_vals(self, reg: int) -> Dict[str, 'ClassicalValT']:
-        return {'reg': ints_to_bits(np.array([reg]), self.dtype.num_qubits)[0]}
+        x = int(reg)
+        return {'reg': np.array([(x >> i) & 1 for i in range(self._n - 1, -1, -1)], dtype=np.uint8)}
 
     def add_my_tensors(
         self,
@@ -97,18 +111,10 @@ class Split(_BookkeepingBloq):
         incoming: Dict[str, 'SoquetT'],
         outgoing: Dict[str, 'SoquetT'],
     ):
-        import quimb.tensor as qtn
-
         if not isinstance(outgoing['reg'], np.ndarray):
             raise ValueError('Outgoing register must be a numpy array')
-        tn.add(
-            qtn.Tensor(
-                data=np.eye(2**self.dtype.num_qubits, 2**self.dtype.num_qubits).reshape(
-                    (2,) * self.dtype.num_qubits + (2**self.dtype.num_qubits,)
-                ),
-                inds=outgoing['reg'].tolist() + [incoming['reg']],
-                tags=['Split', tag],
-            )
+        self._add_delta_tensor(
+            tn, tag, outgoing['reg'].tolist() + [incoming['reg']], (2,) * self._n + (self._d,)
         )
 
     def wire_symbol(self, reg: Optional[Register], idx: Tuple[int, ...] = tuple()) -> 'WireSymbol':
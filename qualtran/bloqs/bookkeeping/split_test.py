@@ -19,7 +19,8 @@ import sympy
 
 from qualtran import BloqBuilder, QAny, QUInt
 from qualtran.bloqs.basic_gates import XGate
-from qualtran.bloqs.bookkeeping import Split
+from qualtran.bloqs.bookkeeping import Join, Split
+from qualtran.bloqs.bookkeeping._bookkeeping_bloq import _delta_tensor_data
 from qualtran.bloqs.bookkeeping.split import _split
 from qualtran.simulation.classical_sim import call_cbloq_classically
 
@@ -34,6 +35,11 @@ def test_no_symbolic():
         Split(QUInt(n))
 
 
+def test_signature_is_shared():
+    assert Split(QAny(4)).signature is Split(QAny(4)).signature
+    assert Split(QAny(4)).signature is not Split(QUInt(4)).signature
+
+
 def test_classical_sim():
     bb = BloqBuilder()
     x = bb.allocate(4)
@@ -84,5 +90,18 @@ def test_classical_sim_dtypes():
     #     _ = s.call_classically(reg=np.uint16(256))
 
 
+def test_tensor_data():
+    s = Split(QAny(4))
+    np.testing.assert_allclose(s.tensor_contract(), np.eye(2**4))
+    np.testing.assert_allclose(
+        _delta_tensor_data((2,) * 4, 2**4), np.eye(2**4).reshape((2,) * 4 + (2**4,))
+    )
+
+
+def test_zero_width_tensor_contract():
+    np.testing.assert_allclose(Split(QAny(0)).tensor_contract(), [1.0])
+    np.testing.assert_allclose(Join(QAny(0)).tensor_contract(), [1.0])
+
+
 def test_no_circular_import():
     subprocess.check_call(['python', '-c', 'from qualtran.bloqs.bookkeeping import split'])
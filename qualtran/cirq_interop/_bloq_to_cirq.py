@@ -180,7 +180,7 @@ class BloqAsCirqGate(cirq.Gate):
         bloq = self.bloq if power > 0 else self.bloq.adjoint()
 
         try:
-            return BloqAsCirqGate(Power(bloq, abs(power)))
+            return BloqAsCirqGate(Power.make(bloq, abs(power)))
         except ValueError as e:
             raise ValueError(f"Bad power {power}") from e
 